@@ -1,10 +1,35 @@
 import streamlit as st
+from typing import Optional
 from models.black_scholes import BlackScholesOption
 from models.binomial import BinomialOption
 from models.monte_carlo import MonteCarloOption
 from plot import create_pnl_plot, plot_greeks
 
 
+# Pricing helpers take only primitive arguments so that Streamlit can hash them cheaply:
+# their results are reused across reruns as long as the relevant inputs do not change.
+
+@st.cache_data
+def compute_bs(S: float, K: float, T: float, r: float, sigma: float, option_type: str) -> float:
+    """Compute the Black-Scholes price of the option."""
+    return BlackScholesOption(S, K, T, r, sigma, option_type).price()
+
+@st.cache_data
+def compute_binomial(S: float, K: float, T: float, r: float, sigma: float, option_type: str, steps: int) -> float:
+    """Compute the binomial tree price of the option with the given number of steps."""
+    return BinomialOption(S, K, T, r, sigma, option_type).price(steps=steps)
+
+@st.cache_data
+def compute_mc(S: float, K: float, T: float, r: float, sigma: float, option_type: str, n_sims: int, seed: Optional[int] = None) -> float:
+    """Compute the Monte Carlo price of the option with the given number of simulations."""
+    return MonteCarloOption(S, K, T, r, sigma, option_type, seed=seed).price(n_simulations=n_sims)
+
+@st.cache_data
+def compute_greeks(S: float, K: float, T: float, r: float, sigma: float, option_type: str) -> dict:
+    """Compute the Black-Scholes Greeks of the option."""
+    return BlackScholesOption(S, K, T, r, sigma, option_type).greeks()
+
+
 def main() -> None:
     """
     Streamlit dashboard for interactive option pricing analysis.
@@ -22,31 +47,42 @@ def main() -> None:
     
     # Sidebar inputs to let user specify option parameters:
     # Spot price, strike price, time to maturity, risk-free rate,
-    # volatility, option type (call/put), position direction (long/short),
-    # binomial steps and Monte Carlo simulations parameters,
-    # plus an option to fix the random seed for reproducibility
-    st.sidebar.header("Option Parameters")
-    S = st.sidebar.number_input("Spot Price (S)", value=100.0, step=1.0, min_value=0.0)
-    K = st.sidebar.number_input("Strike Price (K)", value=100.0, step=1.0, min_value=0.0)
-    T = st.sidebar.number_input("Time to Maturity (in years)", value=1.0, step=0.1, min_value=0.0)
-    r = st.sidebar.number_input("Risk-free Rate (r)", value=0.05, step=0.01, min_value=-1.0, max_value=1.0)
-    sigma = st.sidebar.number_input("Volatility (σ)", value=0.2, step=0.01, min_value=0.0)
-    option_type = st.sidebar.selectbox("Option Type", ["call", "put"])
+    # volatility, option type (call/put), binomial steps and Monte Carlo
+    # simulations parameters, plus an option to fix the random seed for reproducibility.
+    # They are grouped in a form so that nothing is recomputed until "Compute" is clicked.
+    with st.sidebar.form("params"):
+        st.header("Option Parameters")
+        S = st.number_input("Spot Price (S)", value=100.0, step=1.0, min_value=0.0)
+        K = st.number_input("Strike Price (K)", value=100.0, step=1.0, min_value=0.0)
+        T = st.number_input("Time to Maturity (in years)", value=1.0, step=0.1, min_value=0.0)
+        r = st.number_input("Risk-free Rate (r)", value=0.05, step=0.01, min_value=-1.0, max_value=1.0)
+        sigma = st.number_input("Volatility (σ)", value=0.2, step=0.01, min_value=0.0)
+        option_type = st.selectbox("Option Type", ["call", "put"])
+        binomial_steps = st.number_input("Binomial - Number of steps", 1, 1000, 500, 100)
+        mc_sims = st.number_input("Monte Carlo - Number of steps", 1, 200000, 100000, 25000)
+        use_fixed_seed = st.checkbox("Fixer le seed Monte Carlo", value=True)
+        seed_value = st.number_input("Seed", value=42, min_value=0, step=1)
+        submitted = st.form_submit_button("Compute")
+
+    # Position direction (long/short) only affects the PnL diagram, so it applies immediately
     direction = st.sidebar.selectbox("Position", ["long", "short"])
-    binomial_steps = st.sidebar.number_input("Binomial - Number of steps", 1, 1000, 500, 100)
-    mc_sims = st.sidebar.number_input("Monte Carlo - Number of steps", 1, 200000, 100000, 25000)
-    use_fixed_seed = st.sidebar.checkbox("Fixer le seed Monte Carlo", value=True)
-    if use_fixed_seed:
-        seed_value = st.sidebar.number_input("Seed", value=42, min_value=0, step=1)
     
-    # Initialize option pricing model instances with user inputs:
-    bs_option = BlackScholesOption(S, K, T, r, sigma, option_type)
-    bin_option = BinomialOption(S, K, T, r, sigma, option_type)
-    if use_fixed_seed:
-        mc_option = MonteCarloOption(S, K, T, r, sigma, option_type, seed=seed_value)
-    else:
-        mc_option = MonteCarloOption(S, K, T, r, sigma, option_type)
-    greeks = bs_option.greeks()
+    # Compute option prices and Greeks from the submitted inputs (cached on the inputs),
+    # and keep the results in the session state so the display stays consistent between submissions
+    if submitted or "results" not in st.session_state:
+        params = (S, K, T, r, sigma, option_type)
+        seed = seed_value if use_fixed_seed else None
+        st.session_state["results"] = {
+            "params": params,
+            "bs_price": compute_bs(*params),
+            "bin_price": compute_binomial(*params, steps=binomial_steps),
+            "mc_price": compute_mc(*params, n_sims=mc_sims, seed=seed),
+            "greeks": compute_greeks(*params),
+        }
+    results = st.session_state["results"]
+    params = results["params"]
+    bs_price, bin_price, mc_price = results["bs_price"], results["bin_price"], results["mc_price"]
+    greeks = results["greeks"]
     
     # Display option prices side-by-side for the three methods using styled HTML blocks
     col1, col2, col3 = st.columns(3)
@@ -54,14 +90,14 @@ def main() -> None:
             st.markdown(f"""
             <div class="metric-container">
                 <h3>Black-Scholes</h3>
-                <h2>{bs_option.price():.4f}€</h2>
+                <h2>{bs_price:.4f}€</h2>
             </div>
             """, unsafe_allow_html=True)
     with col2:
         st.markdown(f"""
         <div class="metric-container">
             <h3>Binomial</h3>
-            <h2>{bin_option.price(steps=binomial_steps):.4f}€</h2>
+            <h2>{bin_price:.4f}€</h2>
         </div>
         """, unsafe_allow_html=True)
         
@@ -69,7 +105,7 @@ def main() -> None:
         st.markdown(f"""
         <div class="metric-container">
             <h3>Monte Carlo</h3>
-            <h2>{mc_option.price(n_simulations=mc_sims):.4f}€</h2>
+            <h2>{mc_price:.4f}€</h2>
         </div>
         """, unsafe_allow_html=True)
 
@@ -86,7 +122,7 @@ def main() -> None:
     
     # Plot and display the PnL diagram for the Black-Scholes option
     st.subheader("PnL Diagram")
-    fig = create_pnl_plot(bs_option, direction=direction)
+    fig = create_pnl_plot(*params, direction=direction)
     st.pyplot(fig, use_container_width=True)
 
     st.divider()
@@ -94,7 +130,7 @@ def main() -> None:
 
     # Plot and display the Greeks diagrams for the Black-Scholes option
     st.subheader("Greeks Diagram")
-    fig = plot_greeks(bs_option)
+    fig = plot_greeks(*params)
     st.pyplot(fig, use_container_width=True)
 
 if __name__ == '__main__':
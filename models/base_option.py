@@ -15,12 +15,19 @@ class BaseOption(ABC):
         sigma (float): Volatility of the underlying asset.
         option_type (str): Option type, either 'call' or 'put'.
 
+    Raises:
+        ValueError: If a numerical input is negative or the option type is unknown.
+
     Note:
         This base class is designed for European options only, which can be exercised
         only at expiration. Subclasses must implement the pricing logic specific to
         their respective models.
     """
 
+    # Fixed attribute layout: smaller instances and faster attribute access.
+    # Subclasses that memoize values with `functools.cached_property` keep a `__dict__`.
+    __slots__ = ('S', 'K', 'T', 'r', 'sigma', 'option_type', '_is_call', '_payoff_sign')
+
     def __init__(
         self,
         S: float,
@@ -37,6 +44,12 @@ class BaseOption(ABC):
         self.r = r
         self.sigma = sigma
         self.option_type = option_type.lower()
+        if self.option_type not in ('call', 'put'):
+            raise ValueError("option_type must be 'call' or 'put'")
+        # Option type resolved once, so pricing code can branch on a bool instead of a string,
+        # or use the sign of the payoff max(sign * (S - K), 0) to handle both types without branching
+        self._is_call = self.option_type == 'call'
+        self._payoff_sign = 1.0 if self._is_call else -1.0
     
     @abstractmethod  # All pricing models (Black-Scholes, Binomial, Monte Carlo) must implement this method.
     def price(self) -> float:
@@ -54,8 +67,8 @@ class BaseOption(ABC):
     def validate_inputs(S: float, K: float, T: float, sigma: float) -> None:
         """Validate input parameters for option initialization.
 
-        Ensures all relevant numerical values are strictly positive. Negative or zero
-        values would lead to invalid computations or undefined financial behavior.
+        Ensures all relevant numerical values are non-negative. Negative values would
+        lead to invalid computations or undefined financial behavior.
 
         Args:
             S (float): Spot price.
@@ -64,8 +77,8 @@ class BaseOption(ABC):
             sigma (float): Volatility.
 
         Raises:
-            ValueError: If any of the inputs is not strictly positive.
+            ValueError: If any of the inputs is negative.
         """
 
-        if any ( x < 0 for x in [S,K,T,sigma]):
-            raise ValueError("S, K, T and sigma must be positive")
\ No newline at end of file
+        if S < 0 or K < 0 or T < 0 or sigma < 0:
+            raise ValueError("S, K, T and sigma must be non-negative")
\ No newline at end of file
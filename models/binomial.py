@@ -1,17 +1,75 @@
 from .base_option import BaseOption
 import logging
+from typing import Literal
+import numba
 import numpy as np
+from scipy.special import bdtr, bdtrc
 
 
 logger = logging.getLogger(__name__)
 
+@numba.njit(cache=True, fastmath=True)
+def _binomial_kernel(S: float, K: float, r: float, sigma: float, T: float, steps: int, is_call: int) -> float:
+    """Price a European option on a CRR binomial tree with a compiled scalar loop.
+
+    The option values are kept in a single preallocated vector which is overwritten
+    in place during backward induction, so no temporary array is created per step.
+
+    Args:
+        S (float): Spot price of the underlying asset.
+        K (float): Strike price of the option.
+        r (float): Risk-free interest rate.
+        sigma (float): Volatility of the underlying asset.
+        T (float): Time to maturity (in years).
+        steps (int): Number of discrete time steps in the binomial tree.
+        is_call (int): 1 for a call option, 0 for a put option.
+
+    Returns:
+        float: Option price at the root of the tree (t=0).
+    """
+
+    dt = T / steps # Time increment per step
+    u = np.exp(sigma * np.sqrt(dt)) # Upward movement factor
+    d = 1 / u # Downward movement factor
+    p = (np.exp(r * dt) - d) / (u - d) # Risk-neutral probability of upward move
+    disc = np.exp(-r * dt) # One-step discount factor
+    p_disc = p * disc # Discounted weight of the up branch
+    q_disc = (1 - p) * disc # Discounted weight of the down branch
+
+    # Option values at maturity (payoff), walking down from the highest terminal price.
+    # Consecutive terminal prices differ by a constant factor d / u = d**2, so a running
+    # product replaces the two powers per node of S * u**(steps - i) * d**i.
+    values = np.empty(steps + 1)
+    price = S * np.exp(steps * sigma * np.sqrt(dt)) # S * u**steps
+    ratio = d * d
+    for i in range(steps + 1):
+        if is_call:
+            values[i] = max(price - K, 0.0)
+        else:
+            values[i] = max(K - price, 0.0)
+        price *= ratio
+
+    # Backward induction: values[i + 1] is read before being overwritten at the next i
+    for j in range(steps - 1, -1, -1):
+        for i in range(j + 1):
+            values[i] = p_disc * values[i] + q_disc * values[i + 1]
+
+    return values[0]
+
+try:
+    # Ahead-of-time compiled kernel, built with `python build_ext.py`
+    from .option_kernels import binomial_price as _binomial_price
+except ImportError:
+    _binomial_price = _binomial_kernel
+
 class BinomialOption(BaseOption):
     """
     European option priced using the Cox-Ross-Rubinstein binomial tree model.
 
     In this implementation, we construct a recombining tree of possible asset prices
     and compute the option payoff at maturity. We then use backward induction
-    under the risk-neutral measure to determine the option's present value.
+    under the risk-neutral measure to determine the option's present value, or
+    equivalently its closed-form expression as a sum over the terminal nodes.
     Inherits from the BaseOption class.
 
     Attributes:
@@ -23,47 +81,79 @@ class BinomialOption(BaseOption):
         option_type (str): Type of the option ('call' or 'put').
     """
 
-    def price(self, steps:int) -> float:
-        """Calculate the price of a European option using the binomial tree method.
+    __slots__ = ()
+
+    def price(self, steps:int, method: Literal['closed_form', 'tree'] = 'closed_form') -> float:
+        """Calculate the price of a European option using the binomial model.
 
         Args:
             steps (int): Number of discrete time steps in the binomial tree.
+            method (str): 'closed_form' to sum the discounted terminal payoffs weighted by their
+                binomial probabilities, or 'tree' to run backward induction through the tree.
+                Both give the same price for European options. Defaults to 'closed_form'.
 
         Returns:
-            float: Option price computed through backward induction.
+            float: Option price at the root of the tree (t=0).
 
         Notes:
             - This implementation uses a recombining binomial tree.
             - Because of recombination (i.e., u * d = d * u), the number of final nodes is only (steps + 1),
               not 2^steps as in a generic binary tree. This significantly improves computational efficiency.
+            - Since a European option can only be exercised at maturity, backward induction reduces
+              to an expectation over the terminal nodes, expressed with binomial survival functions
+              (see `_closed_form_price`). Its cost does not grow with the number of steps.
+            - The tree itself is evaluated by the Numba-compiled `_binomial_kernel`, or by its
+              ahead-of-time compiled version when `build_ext.py` has been run.
+            - Backward induction overwrites a single vector of (steps + 1) option values in place,
+              so memory use is O(steps) and no array is allocated per time step.
         """
         
-        logger.info(f"Calculating binomial price with {steps} steps")
+        logger.info(f"Calculating binomial price with {steps} steps ({method})")
+
+        if method == 'closed_form':
+            price = self._closed_form_price(steps)
+        elif method == 'tree':
+            price = _binomial_price(
+                float(self.S), float(self.K), float(self.r), float(self.sigma), float(self.T),
+                int(steps), int(self._is_call)
+            )
+        else:
+            raise ValueError("method must be 'closed_form' or 'tree'")
+
+        logger.debug(f"Calculated price: {price}")
+        return price
+
+    def _closed_form_price(self, steps: int) -> float:
+        """Price the option as a discounted expectation over the terminal nodes of the tree.
+
+        With a = the minimum number of up moves for the call to finish in the money, the price is
+
+            C = S * P'(X >= a) - K * exp(-rT) * P(X >= a)
+            P = K * exp(-rT) * P(X < a) - S * P'(X < a)
+
+        where X ~ Binomial(steps, p) under the risk-neutral probability p, and P' uses
+        p' = p * u * exp(-r * dt), the up probability under the stock measure.
+
+        Args:
+            steps (int): Number of discrete time steps in the binomial tree.
+
+        Returns:
+            float: Option price at the root of the tree (t=0).
+        """
 
         dt = self.T / steps # Time increment per step
         u = np.exp(self.sigma * np.sqrt(dt)) # Upward movement factor
         d = 1 / u # Downward movement factor
         p = (np.exp(self.r * dt) - d) / (u - d) # Risk-neutral probability of upward move
+        p_star = p * u * np.exp(-self.r * dt) # Up probability under the stock measure
+        disc = np.exp(-self.r * self.T)
 
-        # Initialize tree of underlying asset prices
-        prices = np.zeros((steps + 1, steps + 1))
-        for i in range(steps + 1): 
-            prices[i, steps] = self.S * (u**(steps - i)) * (d**i) # Terminal asset prices at maturity
+        # Minimum number of up moves for S * u**a * d**(steps - a) to exceed the strike
+        a = np.clip(np.ceil(np.log(self.K / (self.S * d**steps)) / np.log(u / d)), 0, steps + 1)
 
-        # Initialize option values at maturity (payoff)
-        values = np.zeros_like(prices)
-        for i in range(steps + 1):
-            if self.option_type == "call":
-                values[i, steps] = max(prices[i, steps] - self.K, 0)
-            else:
-                values[i, steps] = max(self.K - prices[i, steps], 0)
-
-        # Backward induction to compute present value
-        for j in range(steps - 1, -1, -1):
-            for i in range(j + 1):
-                values[i, j] = np.exp(-self.r * dt) * (p * values[i, j + 1] + (1 - p) * values[i + 1, j + 1])
-
-        price = values[0, 0] # Option price at the root of the tree (t=0)
-
-        logger.debug(f"Calculated price: {price}")
-        return price
\ No newline at end of file
+        if self._is_call:
+            return self.S * bdtrc(a - 1, steps, p_star) - self.K * disc * bdtrc(a - 1, steps, p)
+        elif a == 0:
+            return 0.0 # Every terminal node is above the strike: the put expires worthless
+        else:
+            return self.K * disc * bdtr(a - 1, steps, p) - self.S * bdtr(a - 1, steps, p_star)
@@ -1,11 +1,63 @@
 from .base_option import BaseOption
+from functools import cached_property
 import logging
+from math import erfc, exp as mexp, pi, sqrt as msqrt
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 
 
 logger = logging.getLogger(__name__)
 
+_NORM_PDF_C = 1 / np.sqrt(2 * np.pi) # Normalization constant of the standard normal density
+
+def _norm_pdf(x):
+    """Standard normal probability density function.
+
+    Evaluated directly rather than through `scipy.stats.norm.pdf`, which adds
+    argument-checking overhead on every call.
+
+    Args:
+        x (float or np.ndarray): Point(s) at which to evaluate the density.
+
+    Returns:
+        float or np.ndarray: The density value(s).
+    """
+
+    return _NORM_PDF_C * np.exp(-0.5 * x * x)
+
+# Scalar versions based on the `math` module, which avoid the per-call dispatch
+# overhead of NumPy/SciPy ufuncs when evaluating a single option.
+
+_INV_SQRT2 = 1 / msqrt(2)
+_INV_SQRT_2PI = 1 / msqrt(2 * pi)
+
+def _ncdf(x: float) -> float:
+    """Standard normal cumulative distribution function for a scalar.
+
+    Uses the complementary error function, which stays accurate in the left tail
+    where 1 + erf(x / sqrt(2)) would lose precision.
+
+    Args:
+        x (float): Point at which to evaluate the distribution function.
+
+    Returns:
+        float: The probability P(Z <= x) for a standard normal Z.
+    """
+
+    return 0.5 * erfc(-x * _INV_SQRT2)
+
+def _npdf(x: float) -> float:
+    """Standard normal probability density function for a scalar.
+
+    Args:
+        x (float): Point at which to evaluate the density.
+
+    Returns:
+        float: The density value.
+    """
+
+    return _INV_SQRT_2PI * mexp(-0.5 * x * x)
+
 class BlackScholesOption(BaseOption):
     """Implements the Black-Scholes option pricing model for European options.
 
@@ -20,8 +72,76 @@ class BlackScholesOption(BaseOption):
         r (float): Risk-free interest rate.
         sigma (float): Volatility of the underlying asset.
         option_type (str): Type of the option ('call' or 'put').
+
+    Note:
+        Intermediate terms (d1, d2, their normal CDF/PDF values and the discount factor)
+        are computed once per instance on first use, as the option parameters are not
+        expected to change after initialization.
     """
 
+    @cached_property
+    def _sqrtT(self) -> float:
+        """Square root of the time to maturity, computed once per instance."""
+
+        # Kept as a NumPy scalar so that divisions by a zero maturity give inf/nan, as with arrays
+        return np.float64(msqrt(self.T))
+
+    @cached_property
+    def _sigma_sqrtT(self) -> float:
+        """Volatility scaled to the option's maturity (sigma * sqrt(T))."""
+
+        return self.sigma * self._sqrtT
+
+    @cached_property
+    def _disc(self) -> float:
+        """Discount factor exp(-r * T) applied to the strike."""
+
+        return mexp(-self.r * self.T)
+
+    @cached_property
+    def _d1(self) -> float:
+        """Cached value of the d1 term."""
+
+        # np.log keeps NumPy semantics for degenerate inputs (S = 0 gives an infinite d1
+        # instead of raising), which math.log would not
+        return (np.log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T) / self._sigma_sqrtT
+
+    @cached_property
+    def _d2(self) -> float:
+        """Cached value of the d2 term."""
+
+        return self._d1 - self._sigma_sqrtT
+
+    @cached_property
+    def _Nd1(self) -> float:
+        """Standard normal CDF evaluated at d1."""
+
+        return _ncdf(self._d1)
+
+    @cached_property
+    def _Nd2(self) -> float:
+        """Standard normal CDF evaluated at d2."""
+
+        return _ncdf(self._d2)
+
+    @cached_property
+    def _N_minus_d1(self) -> float:
+        """Standard normal CDF evaluated at -d1 (used by puts)."""
+
+        return _ncdf(-self._d1)
+
+    @cached_property
+    def _N_minus_d2(self) -> float:
+        """Standard normal CDF evaluated at -d2 (used by puts)."""
+
+        return _ncdf(-self._d2)
+
+    @cached_property
+    def _nd1(self) -> float:
+        """Standard normal PDF evaluated at d1."""
+
+        return _npdf(self._d1)
+
     def d1(self) -> float:
         """Calculates the d1 term used in the Black-Scholes formula.
 
@@ -29,7 +149,7 @@ class BlackScholesOption(BaseOption):
             float: The computed d1 value.
         """
 
-        return (np.log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T) / (self.sigma * np.sqrt(self.T))
+        return self._d1
     
     def d2(self) -> float:
         """Calculates the d2 term used in the Black-Scholes formula.
@@ -38,7 +158,7 @@ class BlackScholesOption(BaseOption):
             float: The computed d2 value.
         """
         
-        return self.d1() - self.sigma * np.sqrt(self.T)
+        return self._d2
 
     def price(self) -> float:
         """Calculates the theoretical Black-Scholes price of the option.
@@ -48,15 +168,11 @@ class BlackScholesOption(BaseOption):
         """
 
         logger.info(f"Calculating BS price for {self.option_type} option")
-        
-        d1 = self.d1()
 
-        d2 = self.d2()
-
-        if self.option_type == "call":
-            price = self.S * norm.cdf(d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
+        if self._is_call:
+            price = self.S * self._Nd1 - self.K * self._disc * self._Nd2
         else:
-            price = self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - self.S * norm.cdf(-d1)
+            price = self.K * self._disc * self._N_minus_d2 - self.S * self._N_minus_d1
         
         logger.info(f"Calculated price: {price}")
         return price
@@ -68,11 +184,10 @@ class BlackScholesOption(BaseOption):
             float: The Delta of the option.
         """
 
-        d1 = self.d1()
-        if self.option_type == "call":
-            return norm.cdf(d1)
+        if self._is_call:
+            return self._Nd1
         else:
-            return norm.cdf(d1) - 1
+            return self._Nd1 - 1
 
     def gamma(self) -> float:
         """Computes the Gamma of the option, which measures the rate of change of Delta.
@@ -81,8 +196,7 @@ class BlackScholesOption(BaseOption):
             float: The Gamma of the option.
         """
 
-        d1 = self.d1()
-        return norm.pdf(d1) / (self.S * self.sigma * np.sqrt(self.T))
+        return self._nd1 / (self.S * self._sigma_sqrtT)
 
     def vega(self) -> float:
         """Computes the Vega of the option, which measures sensitivity to volatility.
@@ -91,8 +205,7 @@ class BlackScholesOption(BaseOption):
             float: The Vega of the option, scaled per 1% change in volatility.
         """
 
-        d1 = self.d1()
-        return self.S * norm.pdf(d1) * np.sqrt(self.T) / 100
+        return self.S * self._nd1 * self._sqrtT / 100
 
     def theta(self) -> float:
         """Computes the Theta of the option, which measures sensitivity to time decay.
@@ -101,16 +214,12 @@ class BlackScholesOption(BaseOption):
             float: The Theta of the option, expressed per day.
         """
 
-        d1 = self.d1()
-        d2 = self.d2()
-        if self.option_type == "call":
-            term1 = -(self.S * norm.pdf(d1) * self.sigma) / (2 * np.sqrt(self.T))
-            term2 = -self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
-            return (term1 + term2) / 365  # par jour
+        term1 = -(self.S * self._nd1 * self.sigma) / (2 * self._sqrtT)
+        if self._is_call:
+            term2 = -self.r * self.K * self._disc * self._Nd2
         else:
-            term1 = -(self.S * norm.pdf(d1) * self.sigma) / (2 * np.sqrt(self.T))
-            term2 = self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-d2)
-            return (term1 + term2) / 365  # par jour
+            term2 = self.r * self.K * self._disc * self._N_minus_d2
+        return (term1 + term2) / 365  # par jour
 
     def rho(self) -> float:
         """Computes the Rho of the option, which measures sensitivity to the interest rate.
@@ -119,11 +228,10 @@ class BlackScholesOption(BaseOption):
             float: The Rho of the option, scaled per 1% change in interest rate.
         """
 
-        d2 = self.d2()
-        if self.option_type == "call":
-            return self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(d2) / 100
+        if self._is_call:
+            return self.K * self.T * self._disc * self._Nd2 / 100
         else:
-            return -self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(-d2) / 100
+            return -self.K * self.T * self._disc * self._N_minus_d2 / 100
 
     def greeks(self) -> dict:
         """Returns a dictionary containing all major Greeks for the option.
@@ -140,6 +248,47 @@ class BlackScholesOption(BaseOption):
             "rho": self.rho(),
         }
 
+    def greeks_vectorized(self, S_arr: np.ndarray) -> dict:
+        """Computes all major Greeks over an array of spot prices in a single vectorized pass.
+
+        The strike, maturity, rate and volatility of the option are kept fixed while
+        the spot price varies, which avoids instantiating one option per spot value.
+
+        Args:
+            S_arr (np.ndarray): Array of spot prices of the underlying asset.
+
+        Returns:
+            dict: A dictionary with keys 'delta', 'gamma', 'vega', 'theta', and 'rho',
+            each mapping to an array of the same shape as `S_arr`.
+        """
+
+        S_arr = np.asarray(S_arr, dtype=float)
+        d1 = (np.log(S_arr / self.K) + (self.r + 0.5 * self.sigma**2) * self.T) / self._sigma_sqrtT
+        d2 = d1 - self._sigma_sqrtT
+        nd1 = _norm_pdf(d1)
+
+        gamma = nd1 / (S_arr * self._sigma_sqrtT)
+        vega = S_arr * nd1 * self._sqrtT / 100
+        term1 = -(S_arr * nd1 * self.sigma) / (2 * self._sqrtT)
+        if self._is_call:
+            Nd2 = ndtr(d2)
+            delta = ndtr(d1)
+            theta = (term1 - self.r * self.K * self._disc * Nd2) / 365  # par jour
+            rho = self.K * self.T * self._disc * Nd2 / 100
+        else:
+            N_minus_d2 = ndtr(-d2)
+            delta = ndtr(d1) - 1
+            theta = (term1 + self.r * self.K * self._disc * N_minus_d2) / 365  # par jour
+            rho = -self.K * self.T * self._disc * N_minus_d2 / 100
+
+        return {
+            "delta": delta,
+            "gamma": gamma,
+            "vega": vega,
+            "theta": theta,
+            "rho": rho,
+        }
+
     def payoff_array(self, spot_range: np.ndarray) -> np.ndarray:
         """Compute the payoff of the option at maturity for a given range of spot prices.
         
@@ -150,12 +299,31 @@ class BlackScholesOption(BaseOption):
             np.ndarray: Payoff values (without accounting for the option premium).
         """
 
-        if self.option_type == 'call':
-            return np.maximum(spot_range - self.K, 0)
-        elif self.option_type == 'put':
-            return np.maximum(self.K - spot_range, 0)
-        else:
-            raise ValueError("option_type must be 'call' or 'put'")
+        return np.maximum(self._payoff_sign * (spot_range - self.K), 0)
+
+    def _pnl_impl(self, spot_range: np.ndarray, price: float, sign: float) -> np.ndarray:
+        """Compute the PnL profile in a single preallocated buffer.
+
+        Args:
+            spot_range (np.ndarray): Array of spot prices at maturity.
+            price (float): Price of the option.
+            sign (float): 1 for a long position, -1 for a short position.
+
+        Returns:
+            np.ndarray: Profit and loss values for each spot price in the range.
+        """
+
+        spot_range = np.asarray(spot_range, dtype=float)
+        out = np.empty_like(spot_range)
+
+        # Payoff, premium and direction are applied in place to the same buffer
+        np.subtract(spot_range, self.K, out=out)
+        np.multiply(out, self._payoff_sign, out=out)
+        np.maximum(out, 0, out=out)
+        np.subtract(out, price, out=out)
+        if sign < 0:
+            np.negative(out, out=out)
+        return out
 
     def pnl_array(self, spot_range: np.ndarray, direction: str = 'long', price: float = None) -> np.ndarray:
         """Compute the PnL profile of the option (payoff net of the option premium).
@@ -169,13 +337,12 @@ class BlackScholesOption(BaseOption):
             np.ndarray: Profit and loss values for each spot price in the range.
         """
 
-        payoff = self.payoff_array(spot_range)
         if price is None:
             price = self.price()
 
         if direction == 'long':
-            return payoff - price
+            return self._pnl_impl(spot_range, price, 1)
         elif direction == 'short':
-            return -(payoff - price)
+            return self._pnl_impl(spot_range, price, -1)
         else:
-            raise ValueError("direction must be 'long' or 'short'")
\ No newline at end of file
+            raise ValueError("direction must be 'long' or 'short'")
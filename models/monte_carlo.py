@@ -1,11 +1,162 @@
 from .base_option import BaseOption
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Optional
+import multiprocessing
+from typing import Literal, Optional
+import numba
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtri
+from scipy.stats import qmc
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_SIZE = 8192 # Number of paths simulated from one seeded random stream
+_TILE_SIZE = 8192 # Number of paths simulated at once by the NumPy backend, so that a tile stays in L2 cache
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _mc_kernel(
+    S: float, K: float, T: float, r: float, sigma: float, n: int, is_call: int, seed: int,
+    antithetic: int, control_variate: int
+) -> tuple:
+    """Estimate the price of a European option with a fused, parallel Monte Carlo loop.
+
+    Each path is drawn, turned into a terminal price and a payoff, and accumulated
+    into scalar sums (including the sum of squared payoffs, for the standard error)
+    without materializing any intermediate array. Paths are split
+    into fixed-size chunks; each chunk reseeds the random stream of the thread running
+    it with `seed + chunk index`, so the result does not depend on the number of threads.
+
+    Two variance reduction techniques can be enabled:
+        - Antithetic variates: each normal draw Z is paired with -Z and the two payoffs
+          are averaged into one sample, so n paths only require ceil(n / 2) draws.
+        - Control variate: the terminal asset price, whose risk-neutral expectation
+          S * exp(r * T) is known, is used to correct the payoff average. The optimal
+          coefficient beta = Cov(payoff, S_T) / Var(S_T) is estimated from the same sample.
+
+    Args:
+        S (float): Spot price of the underlying asset.
+        K (float): Strike price of the option.
+        T (float): Time to maturity (in years).
+        r (float): Risk-free interest rate.
+        sigma (float): Volatility of the underlying asset.
+        n (int): Number of Monte Carlo paths to simulate.
+        is_call (int): 1 for a call option, 0 for a put option.
+        seed (int): Base seed of the random streams.
+        antithetic (int): 1 to use antithetic variates, 0 otherwise.
+        control_variate (int): 1 to use the terminal price as a control variate, 0 otherwise.
+
+    Returns:
+        tuple: The estimated option price and its standard error.
+    """
+
+    drift = (r - 0.5 * sigma**2) * T
+    vol = sigma * np.sqrt(T)
+    forward = S * np.exp(r * T) # Risk-neutral expectation of the terminal price
+    n_samples = (n + 1) // 2 if antithetic else n
+    n_chunks = (n_samples + _CHUNK_SIZE - 1) // _CHUNK_SIZE
+
+    sum_y = 0.0 # Payoffs
+    sum_yy = 0.0
+    sum_x = 0.0 # Terminal prices, centered on their known expectation
+    sum_xy = 0.0
+    sum_xx = 0.0
+    for c in numba.prange(n_chunks):
+        np.random.seed(seed + c)
+        chunk_y = 0.0
+        chunk_yy = 0.0
+        chunk_x = 0.0
+        chunk_xy = 0.0
+        chunk_xx = 0.0
+        for _ in range(c * _CHUNK_SIZE, min((c + 1) * _CHUNK_SIZE, n_samples)):
+            z = np.random.standard_normal()
+
+            # Terminal asset price under the risk-neutral measure (Q)
+            ST = S * np.exp(drift + vol * z)
+            if is_call:
+                y = max(ST - K, 0.0)
+            else:
+                y = max(K - ST, 0.0)
+
+            if antithetic:
+                ST_anti = S * np.exp(drift - vol * z)
+                if is_call:
+                    y = 0.5 * (y + max(ST_anti - K, 0.0))
+                else:
+                    y = 0.5 * (y + max(K - ST_anti, 0.0))
+                ST = 0.5 * (ST + ST_anti)
+
+            x = ST - forward
+            chunk_y += y
+            chunk_yy += y * y
+            chunk_x += x
+            chunk_xy += x * y
+            chunk_xx += x * x
+        sum_y += chunk_y
+        sum_yy += chunk_yy
+        sum_x += chunk_x
+        sum_xy += chunk_xy
+        sum_xx += chunk_xx
+
+    mean_y = sum_y / n_samples
+    var_y = sum_yy / n_samples - mean_y * mean_y
+    if control_variate:
+        mean_x = sum_x / n_samples
+        var_x = sum_xx / n_samples - mean_x * mean_x
+        if var_x > 0.0:
+            cov_xy = sum_xy / n_samples - mean_x * mean_y
+            beta = cov_xy / var_x
+            mean_y -= beta * mean_x
+            var_y -= beta * cov_xy # Variance of the corrected samples y - beta * x
+
+    disc = np.exp(-r * T)
+    stderr = disc * np.sqrt(max(var_y, 0.0) / (n_samples - 1)) if n_samples > 1 else np.nan
+    return disc * mean_y, stderr
+
+try:
+    # Ahead-of-time compiled kernel, built with `python build_ext.py`
+    from .option_kernels import mc_price as _mc_price
+except ImportError:
+    _mc_price = _mc_kernel
+
+def _halton(n: int, base: int = 2) -> np.ndarray:
+    """Generate the first n points of the Halton (van der Corput) sequence in a given base.
+
+    The i-th point is the radical inverse of i: its digits in `base` are mirrored around
+    the radix point. The digits of all indices are extracted together, so the loop only
+    runs ceil(log_base(n + 1)) times. Use bases 2, 3, 5, ... (distinct primes) for each
+    additional dimension.
+
+    Args:
+        n (int): Number of points to generate.
+        base (int): Base of the radical inverse. Defaults to 2.
+
+    Returns:
+        np.ndarray: Array of n points in [0, 1).
+    """
+
+    i = np.arange(1, n + 1) # The index 0 would map to the point 0
+    points = np.zeros(n)
+    f = 1.0
+    while n > 0 and i[-1] > 0:
+        i, digit = np.divmod(i, base)
+        f /= base
+        points += digit * f
+    return points
+
+# State of a `MonteCarloOption.price_parallel` worker process, set once by the pool initializer
+_worker_state = {}
+
+def _init_worker(option: 'MonteCarloOption', key: int, n: int, antithetic: bool, dtype) -> None:
+    """Store the pricing problem in a worker process, so that tasks only carry a tile index."""
+
+    _worker_state.update(option=option, philox=np.random.Philox(key), n=n, antithetic=antithetic, dtype=dtype)
+
+def _worker_tile_sums(tile: int) -> np.ndarray:
+    """Reduce one tile of paths in a worker process (see `MonteCarloOption._philox_tile_sums`)."""
+
+    state = _worker_state
+    return state['option']._philox_tile_sums(state['philox'], tile, state['n'], state['antithetic'], state['dtype'])
+
 class MonteCarloOption(BaseOption):
     """European option pricer using Monte Carlo simulation.
 
@@ -23,6 +174,8 @@ class MonteCarloOption(BaseOption):
         seed (int, optional): Random seed for reproducibility of simulations.
     """
 
+    __slots__ = ('seed', '_rng', '_drift', '_vol_sqrtT', '_forward', '_disc')
+
     def __init__(
         self,
         S: float,
@@ -34,36 +187,503 @@ class MonteCarloOption(BaseOption):
         seed: Optional[int] = None  # Set a random seed for reproducibility, if provided
     ):
         super().__init__(S, K, T, r, sigma, option_type)
-        if seed is not None:
-            np.random.seed(seed)
+        self.seed = seed
+        # Per-instance PCG64 generator: seeding never touches NumPy's global random state
+        self._rng = np.random.default_rng(seed)
+        # Path-independent constants, computed once and reused by every call to `price`
+        self._drift = (r - 0.5 * sigma**2) * T
+        self._vol_sqrtT = sigma * np.sqrt(T)
+        self._forward = S * np.exp(r * T) # Risk-neutral expectation of the terminal price
+        self._disc = np.exp(-r * T)
     
 
-    def price(self, n_simulations):
+    def price(
+        self,
+        n_simulations,
+        method: Literal['pseudo', 'sobol', 'halton'] = 'pseudo',
+        antithetic: bool = True,
+        control_variate: bool = True,
+        backend: Literal['numba', 'numpy', 'numexpr'] = 'numba',
+        device: Literal['cpu', 'cuda'] = 'cpu',
+        dtype=np.float64,
+        return_stderr: bool = False,
+        n_threads: int = 1
+    ):
         """Estimate the price of a European option using Monte Carlo simulation.
 
         Simulates terminal prices of the underlying asset using a geometric Brownian motion (GBM)
         and calculates the expected discounted payoff under the risk-neutral measure.
+        With pseudo-random sampling, the simulation runs by default in the Numba-compiled `_mc_kernel`
+        (or its ahead-of-time compiled version when `build_ext.py` has been run), which streams
+        each path through registers instead of allocating arrays of size `n_simulations`.
 
         Args:
             n_simulations (int): Number of Monte Carlo paths to simulate.
+            method (str): 'pseudo' for pseudo-random normal draws, or a low-discrepancy sequence
+                mapped to normals through the inverse CDF (quasi-Monte Carlo): 'sobol' for a scrambled
+                Sobol sequence, whose sample size is rounded up to a power of two, or 'halton' for
+                a base-2 Halton sequence randomized by a random shift modulo 1. Defaults to 'pseudo'.
+            antithetic (bool): Pair each normal draw Z with -Z to reduce variance. Defaults to True.
+            control_variate (bool): Use the terminal asset price, whose expectation is known,
+                as a control variate to reduce variance. Defaults to True.
+            backend (str): 'numba' for the fused compiled kernel, or 'numpy' to draw normals from
+                the instance generator and price them with vectorized array operations, in tiles of
+                `_TILE_SIZE` paths that stay in cache, or 'numexpr' to evaluate the path expressions
+                in fused, multithreaded loops with numexpr (which must be installed, and only runs on
+                the CPU). Quasi-random sequences are always priced with array operations. Defaults to 'numba'.
+            device (str): 'cpu', or 'cuda' to run the array operations on a GPU with CuPy (which must
+                be installed). Pseudo-random normals are then drawn on the GPU, and only the price is
+                copied back to the host. Defaults to 'cpu'.
+            dtype (type): Floating-point type of the simulated arrays, np.float64 or np.float32.
+                Single precision halves memory traffic, and its rounding error is far below the
+                Monte Carlo sampling error; averages are still accumulated in double precision.
+                Ignored by the Numba kernel, which keeps no arrays. Defaults to np.float64.
+            return_stderr (bool): Also return the standard error of the estimate, computed from
+                the variance of the (variance-reduced) samples. Defaults to False.
+            n_threads (int): Number of threads pricing the tiles of the NumPy backend with
+                pseudo-random sampling on the CPU. With more than one thread, each tile draws from
+                its own Philox substream, so the result depends on the seed but not on the number
+                of threads. Ignored by the other backends and sampling methods. Defaults to 1.
 
         Returns:
-            float: The estimated option price.
+            float or tuple: The estimated option price, or the price and its standard error
+                if `return_stderr` is True.
         """
 
-        logger.info(f"Calculating MC price with {n_simulations} simulations")
+        logger.info(f"Calculating MC price with {n_simulations} simulations ({method}, {backend}, {device})")
 
-        Z = np.random.standard_normal(n_simulations)
-        
-        # Simulate terminal asset prices under the risk-neutral measure (Q)
-        ST = self.S * np.exp((self.r - 0.5 * self.sigma**2) * self.T + self.sigma * np.sqrt(self.T) * Z)
+        if backend not in ('numba', 'numpy', 'numexpr'):
+            raise ValueError("backend must be 'numba', 'numpy' or 'numexpr'")
+        if device not in ('cpu', 'cuda'):
+            raise ValueError("device must be 'cpu' or 'cuda'")
+        if backend == 'numexpr' and device != 'cpu':
+            raise ValueError("backend='numexpr' only runs on device='cpu'")
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be np.float32 or np.float64")
+        if n_threads < 1:
+            raise ValueError("n_threads must be at least 1")
+
+        if method == 'pseudo' and backend == 'numba' and device == 'cpu':
+            # Seed the kernel from the instance generator so that a seeded option stays reproducible
+            seed = int(self._rng.integers(0, 2**31 - _CHUNK_SIZE))
 
-        if self.option_type == "call":
-            payoff = np.maximum(ST - self.K, 0)
+            price, stderr = _mc_price(
+                float(self.S), float(self.K), float(self.T), float(self.r), float(self.sigma),
+                int(n_simulations), int(self._is_call), seed,
+                int(antithetic), int(control_variate)
+            )
         else:
-            payoff = np.maximum(self.K - ST, 0)
+            # With antithetic variates, each normal draw accounts for two paths
+            n_draws = (n_simulations + 1) // 2 if antithetic else n_simulations
+            if backend == 'numexpr':
+                Z = self._draw_normals(n_draws, method, device, dtype)
+                price, stderr = self._price_numexpr(Z, antithetic, control_variate)
+            elif method == 'pseudo' and device == 'cpu' and n_threads > 1:
+                price, stderr = self._price_pseudo_threaded(n_draws, antithetic, control_variate, dtype, n_threads)
+            elif method == 'pseudo' and device == 'cpu':
+                price, stderr = self._price_pseudo_tiled(n_draws, antithetic, control_variate, dtype)
+            else:
+                Z = self._draw_normals(n_draws, method, device, dtype)
+                price, stderr = self._price_from_normals(Z, antithetic, control_variate)
+
+        price, stderr = float(price), float(stderr)
+        logger.info(f"Calculated price: {price} (standard error: {stderr})")
+        return (price, stderr) if return_stderr else price
+
+    def price_convergence(
+        self,
+        ns_list,
+        method: Literal['pseudo', 'sobol', 'halton'] = 'pseudo',
+        antithetic: bool = True,
+        control_variate: bool = True,
+        device: Literal['cpu', 'cuda'] = 'cpu',
+        dtype=np.float64
+    ) -> list:
+        """Estimate the option price for several numbers of simulations from nested samples.
+
+        The normal draws for the largest number of simulations are generated once, and each
+        estimate uses a prefix of them: the estimate for a larger sample extends the one for a
+        smaller sample instead of being drawn independently. This saves the draws of all the
+        smaller samples and exposes the convergence of a single sequence of paths.
+
+        Args:
+            ns_list (list of int): Numbers of Monte Carlo paths to simulate.
+            method (str): Sampling method, 'pseudo', 'sobol' or 'halton' (see `price`). Defaults to 'pseudo'.
+            antithetic (bool): Pair each normal draw Z with -Z to reduce variance. Defaults to True.
+            control_variate (bool): Use the terminal asset price as a control variate. Defaults to True.
+            device (str): 'cpu', or 'cuda' to run on a GPU with CuPy. Defaults to 'cpu'.
+            dtype (type): Floating-point type of the simulated arrays. Defaults to np.float64.
+
+        Returns:
+            list of float: The estimated option prices, in the order of `ns_list`.
+        """
+
+        if device not in ('cpu', 'cuda'):
+            raise ValueError("device must be 'cpu' or 'cuda'")
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be np.float32 or np.float64")
+
+        # With antithetic variates, each normal draw accounts for two paths
+        draws = [(n + 1) // 2 if antithetic else n for n in ns_list]
+        Z = self._draw_normals(max(draws), method, device, dtype)
+        return [float(self._price_from_normals(Z[:n], antithetic, control_variate)[0]) for n in draws]
+
+    def price_parallel(
+        self,
+        n_simulations,
+        n_workers: Optional[int] = None,
+        antithetic: bool = True,
+        control_variate: bool = True,
+        dtype=np.float64,
+        return_stderr: bool = False
+    ):
+        """Estimate the option price with pseudo-random paths spread over a pool of processes.
+
+        Intended for very large numbers of simulations: each worker process prices tiles of
+        `_TILE_SIZE` paths with NumPy and returns their sums, which are combined by the parent
+        process. The tiles draw from the same Philox substreams as `price` with `n_threads > 1`,
+        so for a given seed the price does not depend on the number of workers, and matches the
+        threaded NumPy backend. Starting the pool costs tens of milliseconds, which is only
+        amortized for millions of paths.
+
+        Args:
+            n_simulations (int): Number of Monte Carlo paths to simulate.
+            n_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            antithetic (bool): Pair each normal draw Z with -Z to reduce variance. Defaults to True.
+            control_variate (bool): Use the terminal asset price as a control variate. Defaults to True.
+            dtype (type): Floating-point type of the simulated arrays. Defaults to np.float64.
+            return_stderr (bool): Also return the standard error of the estimate. Defaults to False.
+
+        Returns:
+            float or tuple: The estimated option price, or the price and its standard error
+                if `return_stderr` is True.
+        """
+
+        logger.info(f"Calculating MC price with {n_simulations} simulations ({n_workers or 'all'} processes)")
+
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be np.float32 or np.float64")
+
+        # With antithetic variates, each normal draw accounts for two paths
+        n_draws = (n_simulations + 1) // 2 if antithetic else n_simulations
+        n_tiles = (n_draws + _TILE_SIZE - 1) // _TILE_SIZE
+        key = int(self._rng.integers(2**63))
+
+        initargs = (self, key, n_draws, antithetic, dtype)
+        with multiprocessing.Pool(n_workers, initializer=_init_worker, initargs=initargs) as pool:
+            # Tile sums are added in tile order, so the result does not depend on scheduling
+            sums = sum(pool.map(_worker_tile_sums, range(n_tiles)), np.zeros(6))
+
+        price, stderr = (float(value) for value in self._estimate(sums, control_variate))
+        logger.info(f"Calculated price: {price} (standard error: {stderr})")
+        return (price, stderr) if return_stderr else price
+
+    def _draw_normals(self, n: int, method: str, device: str, dtype=np.float64):
+        """Draw standard normal samples with the requested sampling method.
+
+        Args:
+            n (int): Number of samples (rounded up to a power of two for Sobol sequences).
+            method (str): 'pseudo', 'sobol' or 'halton' (see `price`).
+            device (str): 'cpu' for a NumPy array, 'cuda' for a CuPy array on the GPU.
+            dtype (type): Floating-point type of the samples. Defaults to np.float64.
+
+        Returns:
+            np.ndarray or cupy.ndarray: The standard normal samples.
+        """
+
+        if device == 'cuda':
+            try:
+                import cupy as cp # Optional dependency, only needed for GPU pricing
+            except ImportError as e:
+                raise ImportError("device='cuda' requires CuPy to be installed") from e
+
+        if method == 'pseudo':
+            if device == 'cuda':
+                return cp.random.default_rng(int(self._rng.integers(2**63))).standard_normal(n, dtype=dtype)
+            return self._rng.standard_normal(n, dtype=dtype)
+        elif method == 'sobol':
+            sampler = qmc.Sobol(d=1, scramble=True, seed=self._rng)
+            u = sampler.random_base2(m=max(int(np.ceil(np.log2(n))), 0))[:, 0]
+        elif method == 'halton':
+            # Cranley-Patterson rotation: a random shift modulo 1 randomizes the sequence
+            u = (_halton(n) + self._rng.random()) % 1
+        else:
+            raise ValueError("method must be 'pseudo', 'sobol' or 'halton'")
+
+        Z = ndtri(np.clip(u, 1e-12, 1 - 1e-12)).astype(dtype, copy=False)
+        return cp.asarray(Z) if device == 'cuda' else Z
+
+    def _simulate(self, Z: np.ndarray, vol: float, ST: np.ndarray = None, payoff: np.ndarray = None) -> tuple:
+        """Compute terminal asset prices and payoffs from normal draws, reusing buffers in place.
+
+        Args:
+            Z (np.ndarray): Standard normal draws. Left unchanged.
+            vol (float): Volatility over the option's life (sigma * sqrt(T)), negated for antithetic paths.
+            ST (np.ndarray, optional): Buffer of the same shape as Z receiving the terminal prices.
+            payoff (np.ndarray, optional): Buffer of the same shape as Z receiving the payoffs.
+
+        Returns:
+            tuple: Arrays of terminal asset prices and of the corresponding payoffs.
+        """
+
+        # Constants are cast to the array type so that single-precision arrays are not upcast
+        cast = Z.dtype.type
 
-        price = np.exp(-self.r * self.T) * np.mean(payoff)
+        # Simulate terminal asset prices under the risk-neutral measure (Q)
+        ST = np.multiply(Z, cast(vol), out=ST)
+        ST += cast(self._drift)
+        np.exp(ST, out=ST)
+        ST *= cast(self.S)
+
+        payoff = np.subtract(ST, cast(self.K), out=payoff)
+        payoff *= cast(self._payoff_sign)
+        np.maximum(payoff, 0, out=payoff)
+        return ST, payoff
+
+    def _path_sums(self, Z: np.ndarray, antithetic: bool, buffers: list = None) -> np.ndarray:
+        """Simulate the paths of an array of normal draws and reduce them to the sums needed by `_estimate`.
+
+        Vectorized counterpart of the inner loop of `_mc_kernel`: sums over several arrays of
+        draws can be added together, exactly as the kernel adds the sums of its chunks.
+        NumPy functions dispatch to CuPy when given GPU arrays, so the same code runs on both devices.
+
+        Args:
+            Z (np.ndarray): Standard normal draws, one per path (or per antithetic pair).
+            antithetic (bool): Pair each draw Z with -Z.
+            buffers (list, optional): Four buffers of the same shape as Z, reused for the terminal
+                prices and payoffs of the paths and of their antithetic counterparts.
+
+        Returns:
+            np.ndarray: The number of samples, and the sums of the payoffs y, of y * y, of the terminal
+                prices centered on their known expectation x, of x * x, and of x * y.
+        """
+
+        if buffers is None:
+            buffers = [None] * 4
+
+        ST, payoff = self._simulate(Z, self._vol_sqrtT, buffers[0], buffers[1])
+
+        if antithetic:
+            ST_anti, payoff_anti = self._simulate(Z, -self._vol_sqrtT, buffers[2], buffers[3])
+            payoff += payoff_anti
+            payoff *= 0.5
+            ST += ST_anti
+            ST *= 0.5
+
+        # Terminal prices centered on their known risk-neutral expectation
+        x = ST
+        x -= x.dtype.type(self._forward)
+        return self._reduce(x, payoff)
+
+    @staticmethod
+    def _reduce(x: np.ndarray, payoff: np.ndarray) -> np.ndarray:
+        """Reduce the centered terminal prices and payoffs of a set of paths to the sums of `_path_sums`.
+
+        Args:
+            x (np.ndarray): Terminal prices centered on their known risk-neutral expectation.
+            payoff (np.ndarray): Payoffs of the same paths.
+
+        Returns:
+            np.ndarray: The number of samples and the path sums (see `_path_sums`).
+        """
+
+        # Sums are accumulated in double precision whatever the array type
+        return np.array([
+            x.shape[0],
+            float(np.sum(payoff, dtype=np.float64)),
+            float(np.sum(payoff * payoff, dtype=np.float64)),
+            float(np.sum(x, dtype=np.float64)),
+            float(np.sum(x * x, dtype=np.float64)),
+            float(np.sum(x * payoff, dtype=np.float64)),
+        ])
+
+    def _estimate(self, sums: np.ndarray, control_variate: bool) -> tuple:
+        """Compute the discounted price estimate and its standard error from the sums of `_path_sums`.
+
+        Args:
+            sums (np.ndarray): Number of samples and path sums, as returned by `_path_sums`.
+            control_variate (bool): Use the terminal asset price as a control variate.
+
+        Returns:
+            tuple: The estimated option price and its standard error.
+        """
+
+        n, sum_y, sum_yy, sum_x, sum_xx, sum_xy = sums
+        mean_y = sum_y / n
+        var_y = sum_yy / n - mean_y * mean_y
+        if control_variate:
+            mean_x = sum_x / n
+            var_x = sum_xx / n - mean_x * mean_x
+            if var_x > 0:
+                cov_xy = sum_xy / n - mean_x * mean_y
+                beta = cov_xy / var_x
+                mean_y -= beta * mean_x
+                var_y -= beta * cov_xy # Variance of the corrected samples y - beta * x
+
+        stderr = self._disc * np.sqrt(max(var_y, 0.0) / (n - 1)) if n > 1 else np.nan
+        return self._disc * mean_y, stderr
+
+    def _price_tiles(self, tiles, antithetic: bool, control_variate: bool, dtype) -> tuple:
+        """Price paths given as a sequence of tiles of normal draws, each reduced while it is cache-resident.
+
+        Every tile is simulated in the same preallocated buffers, so memory use does not grow with
+        the number of paths and the exp/payoff/sum chain reads data that is still in cache.
+
+        Args:
+            tiles (iterable of np.ndarray): Arrays of at most `_TILE_SIZE` standard normal draws.
+            antithetic (bool): Pair each draw Z with -Z.
+            control_variate (bool): Use the terminal asset price as a control variate.
+            dtype (type): Floating-point type of the draws.
+
+        Returns:
+            tuple: The estimated option price and its standard error.
+        """
+
+        buffers = [np.empty(_TILE_SIZE, dtype=dtype) for _ in range(4)]
+        sums = np.zeros(6)
+        for Z in tiles:
+            m = Z.shape[0]
+            sums += self._path_sums(Z, antithetic, [buffer[:m] for buffer in buffers])
+        return self._estimate(sums, control_variate)
+
+    def _price_pseudo_tiled(self, n: int, antithetic: bool, control_variate: bool, dtype=np.float64) -> tuple:
+        """Price pseudo-random paths drawn tile by tile into a single reused buffer.
+
+        The draws come from the instance generator in the same order as `_draw_normals`,
+        so the estimate matches pricing the whole array at once.
+
+        Args:
+            n (int): Number of normal draws.
+            antithetic (bool): Pair each draw Z with -Z.
+            control_variate (bool): Use the terminal asset price as a control variate.
+            dtype (type): Floating-point type of the draws. Defaults to np.float64.
+
+        Returns:
+            tuple: The estimated option price and its standard error.
+        """
+
+        Z = np.empty(_TILE_SIZE, dtype=dtype)
+        tiles = (
+            self._rng.standard_normal(out=Z[:min(_TILE_SIZE, n - start)], dtype=dtype)
+            for start in range(0, n, _TILE_SIZE)
+        )
+        return self._price_tiles(tiles, antithetic, control_variate, dtype)
+
+    def _price_pseudo_threaded(
+        self, n: int, antithetic: bool, control_variate: bool, dtype=np.float64, n_threads: int = 2
+    ) -> tuple:
+        """Price pseudo-random paths in tiles spread over a pool of threads.
+
+        A single generator cannot be shared by concurrent threads, and which thread prices which
+        tile is not deterministic. Each tile therefore draws from its own substream: a Philox
+        counter-based generator, keyed from the instance generator, jumped ahead by the tile index.
+        Jumping a counter-based generator is a constant-time counter increment, and the substreams
+        never overlap. NumPy releases the GIL while drawing and evaluating ufuncs, so the tiles
+        run concurrently.
+
+        Args:
+            n (int): Number of normal draws.
+            antithetic (bool): Pair each draw Z with -Z.
+            control_variate (bool): Use the terminal asset price as a control variate.
+            dtype (type): Floating-point type of the draws. Defaults to np.float64.
+            n_threads (int): Number of threads. Defaults to 2.
+
+        Returns:
+            tuple: The estimated option price and its standard error.
+        """
+
+        philox = np.random.Philox(int(self._rng.integers(2**63)))
+
+        def tile_sums(tile: int) -> np.ndarray:
+            return self._philox_tile_sums(philox, tile, n, antithetic, dtype)
+
+        n_tiles = (n + _TILE_SIZE - 1) // _TILE_SIZE
+        with ThreadPoolExecutor(max_workers=n_threads) as pool:
+            # Tile sums are added in tile order, so the result does not depend on scheduling
+            sums = sum(pool.map(tile_sums, range(n_tiles)), np.zeros(6))
+        return self._estimate(sums, control_variate)
+
+    def _philox_tile_sums(self, philox: np.random.Philox, tile: int, n: int, antithetic: bool, dtype) -> np.ndarray:
+        """Draw one tile of normals from its Philox substream and reduce its paths to sums.
+
+        Args:
+            philox (np.random.Philox): Generator of the first substream, jumped ahead by `tile`.
+            tile (int): Index of the tile.
+            n (int): Total number of normal draws over all tiles.
+            antithetic (bool): Pair each draw Z with -Z.
+            dtype (type): Floating-point type of the draws.
+
+        Returns:
+            np.ndarray: The number of samples and the path sums (see `_path_sums`).
+        """
+
+        rng = np.random.Generator(philox.jumped(tile))
+        Z = rng.standard_normal(min(_TILE_SIZE, n - tile * _TILE_SIZE), dtype=dtype)
+        return self._path_sums(Z, antithetic)
+
+    def _price_numexpr(self, Z: np.ndarray, antithetic: bool, control_variate: bool) -> tuple:
+        """Compute the discounted expected payoff from normal draws with numexpr.
+
+        Each expression, from the normal draw to the payoff, is compiled by numexpr into a single
+        multithreaded loop that streams the arrays through the cache in blocks, without the
+        intermediate arrays created by chaining NumPy operations.
+
+        Args:
+            Z (np.ndarray): Standard normal draws, one per path (or per antithetic pair).
+            antithetic (bool): Pair each draw Z with -Z.
+            control_variate (bool): Use the terminal asset price as a control variate.
+
+        Returns:
+            tuple: The estimated option price and its standard error.
+
+        Raises:
+            ImportError: If numexpr is not installed.
+        """
+
+        try:
+            import numexpr as ne # Optional dependency, only needed for the numexpr backend
+        except ImportError as e:
+            raise ImportError("backend='numexpr' requires numexpr to be installed") from e
+
+        # Constants are cast to the array type so that single-precision arrays are not upcast
+        cast = Z.dtype.type
+        constants = {
+            'S': cast(self.S), 'K': cast(self.K), 'phi': cast(self._payoff_sign),
+            'drift': cast(self._drift), 'vol': cast(self._vol_sqrtT), 'F': cast(self._forward),
+            'half': cast(0.5), 'zero': cast(0),
+        }
+
+        ST = ne.evaluate("S * exp(drift + vol * Z)", local_dict={**constants, 'Z': Z})
+        payoff = ne.evaluate("where(phi * (ST - K) > zero, phi * (ST - K), zero)", local_dict={**constants, 'ST': ST})
+        if antithetic:
+            ST_anti = ne.evaluate("S * exp(drift - vol * Z)", local_dict={**constants, 'Z': Z})
+            ne.evaluate(
+                "half * (payoff + where(phi * (ST_anti - K) > zero, phi * (ST_anti - K), zero))",
+                local_dict={**constants, 'payoff': payoff, 'ST_anti': ST_anti}, out=payoff
+            )
+            ne.evaluate("half * (ST + ST_anti)", local_dict={**constants, 'ST': ST, 'ST_anti': ST_anti}, out=ST)
+
+        # Terminal prices centered on their known risk-neutral expectation
+        x = ne.evaluate("ST - F", local_dict={**constants, 'ST': ST}, out=ST)
+        return self._estimate(self._reduce(x, payoff), control_variate)
+
+    def _price_from_normals(self, Z: np.ndarray, antithetic: bool, control_variate: bool) -> tuple:
+        """Compute the discounted expected payoff from an array of standard normal draws.
+
+        Vectorized counterpart of `_mc_kernel`, used when the normal draws are generated
+        as a whole array rather than one at a time inside the kernel. Host arrays are
+        processed in cache-sized tiles; GPU arrays are processed at once.
+
+        Args:
+            Z (np.ndarray): Standard normal draws, one per path (or per antithetic pair).
+            antithetic (bool): Pair each draw Z with -Z.
+            control_variate (bool): Use the terminal asset price as a control variate.
+
+        Returns:
+            tuple: The estimated option price and its standard error.
+        """
 
-        logger.info(f"Calculated price: {price}")
-        return price
\ No newline at end of file
+        if isinstance(Z, np.ndarray):
+            tiles = (Z[start:start + _TILE_SIZE] for start in range(0, Z.shape[0], _TILE_SIZE))
+            return self._price_tiles(tiles, antithetic, control_variate, Z.dtype)
+        return self._estimate(self._path_sums(Z, antithetic), control_variate)
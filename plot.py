@@ -25,13 +25,21 @@ def setup_plot_style() -> None:
         'axes.spines.bottom': True,
     })
 
-#@st.cache_data
-def create_pnl_plot(option : BlackScholesOption, direction='long'):
+@st.cache_data
+def create_pnl_plot(S: float, K: float, T: float, r: float, sigma: float, option_type: str, direction='long'):
     """
     Generate a payoff (PnL) plot of the option over a range of underlying prices.
+
+    The option is described by primitive parameters rather than an option instance
+    so that Streamlit can hash them cheaply and reuse the figure across reruns.
     
     Args:
-        option (BlackScholesOption): The option instance to analyze.
+        S (float): Spot price of the underlying asset.
+        K (float): Strike price of the option.
+        T (float): Time to maturity (in years).
+        r (float): Risk-free interest rate.
+        sigma (float): Volatility of the underlying asset.
+        option_type (str): Type of the option ('call' or 'put').
         direction (str): Position direction, either 'long' or 'short'.
     
     Returns:
@@ -39,12 +47,20 @@ def create_pnl_plot(option : BlackScholesOption, direction='long'):
     """
 
     setup_plot_style()
+    option = BlackScholesOption(S, K, T, r, sigma, option_type)
     
     # Define the range of underlying prices around the strike price
     spot_range = np.linspace(0.5 * option.K, 1.5 * option.K, 200)
 
+    # Insert the breakeven price (where the payoff equals the premium) into the range,
+    # so the PnL curve has an exact zero and each colored region is a single polygon
+    price = option.price()
+    breakeven = option.K + price if option.option_type == 'call' else option.K - price
+    if spot_range[0] < breakeven < spot_range[-1]:
+        spot_range = np.insert(spot_range, np.searchsorted(spot_range, breakeven), breakeven)
+
     # Calculate the PnL values across this price range
-    pnl = option.pnl_array(spot_range, direction=direction)
+    pnl = option.pnl_array(spot_range, direction=direction, price=price)
     
     # Plot the PnL curve and color regions of profit (green) and loss (red)
     fig, ax = plt.subplots(1,1)
@@ -64,64 +80,50 @@ def create_pnl_plot(option : BlackScholesOption, direction='long'):
     
     return fig
 
-#@st.cache_data
-def plot_greeks(option: BlackScholesOption):
+@st.cache_resource
+def _greeks_figure():
     """
-    Plot the main option Greeks (Delta, Gamma, Vega, Theta, Rho) across a range of spot prices.
-    
-    Args:
-        option (BlackScholesOption): The option instance to analyze.
+    Build the Greeks figure once and return it with handles to its data-dependent artists.
+
+    The figure is cached as a Streamlit resource and reused across reruns: `plot_greeks`
+    only updates the data of the returned artists instead of rebuilding the whole layout.
     
     Returns:
-        matplotlib.figure.Figure: The figure containing subplots of each Greek.
+        tuple: The matplotlib Figure and a dictionary mapping each Greek name to the
+        handles of its axes, curve, filled area, strike/spot lines, current-value dot and label.
     """
 
     setup_plot_style()
     
-    spot_range = np.linspace(0.5 * option.K, 1.5 * option.K, 100)
-    deltas, gammas, vegas, thetas, rhos = [], [], [], [], []
-    
-    # Loop over spot prices to instantiate option objects and compute Greeks
-    for S in spot_range:
-        temp_option = BlackScholesOption(S=S, K=option.K, T=option.T, 
-                                       sigma=option.sigma, r=option.r, 
-                                       option_type=option.option_type)
-        deltas.append(temp_option.delta())
-        gammas.append(temp_option.gamma())
-        vegas.append(temp_option.vega())
-        thetas.append(temp_option.theta())
-        rhos.append(temp_option.rho())
-    
     colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
     
-    fig, axs = plt.subplots(2, 3, figsize=(15, 10))
-    fig.suptitle('Option Sensitivities (Greeks)', fontsize=18, fontweight='bold')
+    fig, axs = plt.subplots(2, 3, figsize=(10, 6), dpi=80)
+    fig.suptitle('Option Sensitivities (Greeks)', fontsize=16, fontweight='bold')
     
-    greeks_data = {
-        'Delta (Δ)': (deltas, 'Price Sensitivity', colors[0]),
-        'Gamma (Γ)': (gammas, 'Delta Sensitivity', colors[1]),
-        'Vega (ν)': (vegas, 'Volatility Sensitivity', colors[2]),
-        'Theta (Θ)': (thetas, 'Time Decay', colors[3]),
-        'Rho (ρ)': (rhos, 'Interest Rate Sensitivity', colors[4])
+    greeks_layout = {
+        'delta': ('Delta (Δ)', 'Price Sensitivity', colors[0]),
+        'gamma': ('Gamma (Γ)', 'Delta Sensitivity', colors[1]),
+        'vega': ('Vega (ν)', 'Volatility Sensitivity', colors[2]),
+        'theta': ('Theta (Θ)', 'Time Decay', colors[3]),
+        'rho': ('Rho (ρ)', 'Interest Rate Sensitivity', colors[4])
     }
     
     positions = [(0,0), (0,1), (0,2), (1,0), (1,1)]
+    handles = {}
     
-    for i, (greek, (values, description, color)) in enumerate(greeks_data.items()):
+    for i, (name, (greek, description, color)) in enumerate(greeks_layout.items()):
         row, col = positions[i]
         ax = axs[row, col]
-        ax.plot(spot_range, values, linewidth=3, color=color, alpha=0.8)
-        ax.fill_between(spot_range, values, alpha=0.2, color=color)
+        line, = ax.plot([], [], linewidth=3, color=color, alpha=0.8)
 
         # Highlight the strike price (red dashed line) and current spot price (blue dashed line)
-        ax.axvline(option.K, color='red', linestyle='--', alpha=0.6, linewidth=1)
-        ax.axvline(option.S, color='blue', linestyle='--', alpha=0.6, linewidth=1)
+        strike_line = ax.axvline(0, color='red', linestyle='--', alpha=0.6, linewidth=1)
+        spot_line = ax.axvline(0, color='blue', linestyle='--', alpha=0.6, linewidth=1)
         ax.axhline(0, color='black', linestyle='-', alpha=0.4, linewidth=1)
         
-        # Mark the current Greek value with a prominent dot and annotate it
-        current_value = values[np.argmin(np.abs(spot_range - option.S))]
-        ax.scatter([option.S], [current_value], color=color, s=100, zorder=5,
-                  edgecolors='white', linewidth=2)
+        # Mark the current Greek value with a prominent dot
+        dot = ax.scatter([0], [0], color=color, s=100, zorder=5,
+                         edgecolors='white', linewidth=2)
         
         ax.set_title(f'{greek}\n{description}', fontweight='bold', pad=10)
         ax.set_xlabel('Spot Price (€)')
@@ -129,11 +131,14 @@ def plot_greeks(option: BlackScholesOption):
         ax.grid(True, alpha=0.3)
         ax.set_facecolor('#FAFAFA')
         
-        # Mark the current Greek value with a prominent dot and annotate it
-        ax.text(0.02, 0.98, f'Current: {current_value:.4f}', 
-               transform=ax.transAxes, fontsize=10, fontweight='bold',
-               bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8),
-               verticalalignment='top')
+        # Annotate the current Greek value
+        label = ax.text(0.02, 0.98, '', 
+                        transform=ax.transAxes, fontsize=10, fontweight='bold',
+                        bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8),
+                        verticalalignment='top')
+
+        handles[name] = {'ax': ax, 'line': line, 'fill': None, 'strike': strike_line,
+                         'spot': spot_line, 'dot': dot, 'label': label, 'color': color}
     
     # Hide the unused subplot
     axs[1, 2].axis('off')
@@ -155,5 +160,54 @@ def plot_greeks(option: BlackScholesOption):
     ax_legend.text(0.35, 0.45, 'Current Greek value', fontsize=12, transform=ax_legend.transAxes, verticalalignment='center')
 
     
-    plt.tight_layout()
+    fig.tight_layout()
+    return fig, handles
+
+def plot_greeks(S: float, K: float, T: float, r: float, sigma: float, option_type: str):
+    """
+    Plot the main option Greeks (Delta, Gamma, Vega, Theta, Rho) across a range of spot prices.
+
+    The figure layout is built once by `_greeks_figure`; each call only updates the
+    plotted data, which is much cheaper than creating a new figure on every rerun.
+    
+    Args:
+        S (float): Spot price of the underlying asset.
+        K (float): Strike price of the option.
+        T (float): Time to maturity (in years).
+        r (float): Risk-free interest rate.
+        sigma (float): Volatility of the underlying asset.
+        option_type (str): Type of the option ('call' or 'put').
+    
+    Returns:
+        matplotlib.figure.Figure: The figure containing subplots of each Greek.
+    """
+
+    fig, handles = _greeks_figure()
+    option = BlackScholesOption(S, K, T, r, sigma, option_type)
+    
+    spot_range = np.linspace(0.5 * option.K, 1.5 * option.K, 100)
+
+    # Compute every Greek over the whole spot range in a single vectorized pass
+    greeks = option.greeks_vectorized(spot_range)
+    current_index = np.argmin(np.abs(spot_range - option.S))
+    
+    for name, values in greeks.items():
+        h = handles[name]
+        h['line'].set_data(spot_range, values)
+
+        # Filled areas cannot be reshaped in place, so the previous one is replaced
+        if h['fill'] is not None:
+            h['fill'].remove()
+        h['fill'] = h['ax'].fill_between(spot_range, values, alpha=0.2, color=h['color'])
+
+        h['strike'].set_xdata([option.K, option.K])
+        h['spot'].set_xdata([option.S, option.S])
+
+        current_value = values[current_index]
+        h['dot'].set_offsets([[option.S, current_value]])
+        h['label'].set_text(f'Current: {current_value:.4f}')
+
+        h['ax'].relim()
+        h['ax'].autoscale_view()
+    
     return fig
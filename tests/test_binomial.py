@@ -40,5 +40,17 @@ class TestBinomialOption(unittest.TestCase):
         # Check that the error decreases overall as the number of steps increases
         self.assertTrue(all(errors[i] > errors[i+1] for i in range(len(errors)-1)))
 
+    def test_closed_form_matches_tree(self):
+        """
+        Ensure the closed-form binomial price matches backward induction through the tree.
+        """
+
+        for option_type in ('call', 'put'):
+            for S, K in [(100, 100), (80, 100), (120, 90)]:
+                option = BinomialOption(S=S, K=K, T=1, r=0.05, sigma=0.2, option_type=option_type)
+                for n_steps in (1, 10, 101):
+                    self.assertAlmostEqual(option.price(steps=n_steps),
+                                           option.price(steps=n_steps, method='tree'), places=10)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
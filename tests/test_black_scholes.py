@@ -21,14 +21,18 @@ class TestBlackScholesOption(unittest.TestCase):
     - Pricing accuracy against known reference values.
     - Deep in-the-money put option price behavior.
     - Put-call parity validation to ensure model consistency.
+    - Consistency of the vectorized Greeks with the scalar Greeks.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         Set up common option parameters for call and put options used across multiple tests.
+
+        The options are built once for the whole class, as they are never modified by the tests.
         """
-        self.call_option = BlackScholesOption(S=100, K=100, T=1, r=0.05, sigma=0.2, option_type='call')
-        self.put_option = BlackScholesOption(S=100, K=100, T=1, r=0.05, sigma=0.2, option_type='put')
+        cls.call_option = BlackScholesOption(S=100, K=100, T=1, r=0.05, sigma=0.2, option_type='call')
+        cls.put_option = BlackScholesOption(S=100, K=100, T=1, r=0.05, sigma=0.2, option_type='put')
 
     def test_black_scholes_call(self):
         """
@@ -79,6 +83,20 @@ class TestBlackScholesOption(unittest.TestCase):
         parity = abs((call_price - put_price) - (S - K * np.exp(-r * T)))
         self.assertLess(parity, 1e-10, "Put-call parity violated beyond tolerance.")
 
+    def test_greeks_vectorized_matches_scalar(self):
+        """
+        Check that the vectorized Greeks match the scalar Greeks computed
+        by instantiating one option per spot price, for both calls and puts.
+        """
+        spot_range = np.linspace(50, 150, 11)
+        for option in (self.call_option, self.put_option):
+            vectorized = option.greeks_vectorized(spot_range)
+            for i, S in enumerate(spot_range):
+                scalar = BlackScholesOption(S=S, K=option.K, T=option.T, r=option.r,
+                                            sigma=option.sigma, option_type=option.option_type).greeks()
+                for name, value in scalar.items():
+                    self.assertAlmostEqual(vectorized[name][i], value, places=12)
+
 # python3 -m unittest discover -s tests
 if __name__ == '__main__':
     unittest.main()
@@ -6,7 +6,9 @@ if project_root not in sys.path:
     sys.path.insert(1, project_root)
 from models.monte_carlo import MonteCarloOption
 from models.black_scholes import BlackScholesOption
+import importlib.util
 import unittest
+import numpy as np
 
 
 class TestMonteCarloOption(unittest.TestCase):
@@ -30,18 +32,158 @@ class TestMonteCarloOption(unittest.TestCase):
         # Test with different numbers of simulations
         n_sims_list = [1000, 10000, 100000]
         errors = []
-       
+
+        # A single seeded instance: its setup and generator are reused across sample sizes
+        mc_option = MonteCarloOption(**params, seed=42)
         for n_sims in n_sims_list:
-            mc_option = MonteCarloOption(**params, seed=42)
-            mc_price = mc_option.price(n_simulations=n_sims)
+            mc_price, stderr = mc_option.price(n_simulations=n_sims, return_stderr=True)
             errors.append(abs(bs_price - mc_price))
        
         # Check that the error decreases overall as the number of simulations increases
         self.assertLess(errors[-1], errors[0], "Error should decrease as number of simulations increases.")
 
         # Check that the error with a large number of simulations is acceptable
-        self.assertLess(errors[-1], 0.1, "Error with 100000 simulations should be less than 0.1.")
+        # (antithetic variates and the control variate are enabled by default)
+        self.assertLess(errors[-1], 0.05, "Error with 100000 simulations should be less than 0.05.")
+
+        # Check that the error is consistent with the estimated standard error
+        self.assertLess(errors[-1], 3 * stderr, "Error should be within three standard errors.")
+
+    def test_seed_reproducibility(self):
+        """
+        Test that two options built with the same seed give the same price, including with the
+        parallel Numba kernel whose threads each reseed their random stream per chunk of paths.
+        """
+        params = {
+            'S': 100,
+            'K': 100,
+            'T': 1,
+            'r': 0.05,
+            'sigma': 0.2,
+            'option_type': 'call'
+        }
+
+        for backend in ('numba', 'numpy'):
+            with self.subTest(backend=backend):
+                prices = [MonteCarloOption(**params, seed=42).price(n_simulations=50000, backend=backend)
+                          for _ in range(2)]
+                self.assertEqual(prices[0], prices[1])
+
+    def test_threaded_price_independent_of_thread_count(self):
+        """
+        Test that the threaded NumPy backend, whose tiles draw from per-tile Philox substreams,
+        gives the same price whatever the number of threads, close to Black-Scholes, and the
+        same price as the process-parallel pricer.
+        """
+        params = {
+            'S': 100,
+            'K': 100,
+            'T': 1,
+            'r': 0.05,
+            'sigma': 0.2,
+            'option_type': 'call'
+        }
+
+        bs_price = BlackScholesOption(**params).price()
+
+        prices = [MonteCarloOption(**params, seed=42).price(n_simulations=100000, backend='numpy', n_threads=n_threads)
+                  for n_threads in (2, 3, 4)]
+        self.assertAlmostEqual(prices[0], prices[1], places=12)
+        self.assertAlmostEqual(prices[0], prices[2], places=12)
+        self.assertLess(abs(bs_price - prices[0]), 0.05)
+
+        # Worker processes draw from the same substreams as threads
+        parallel_price = MonteCarloOption(**params, seed=42).price_parallel(n_simulations=100000, n_workers=2)
+        self.assertAlmostEqual(parallel_price, prices[0], places=12)
+
+    def test_quasi_monte_carlo_convergence_with_iterations(self):
+        """
+        Test convergence of the quasi-Monte Carlo (Sobol and Halton) prices with increasing number of simulations.
+        """
+        params = {
+            'S': 100,
+            'K': 100,
+            'T': 1,
+            'r': 0.05,
+            'sigma': 0.2,
+            'option_type': 'call'
+        }
+
+        bs_price = BlackScholesOption(**params).price()
+
+        n_sims_list = [1000, 10000, 100000]
+
+        for method in ('sobol', 'halton'):
+            with self.subTest(method=method):
+                errors = []
+                mc_option = MonteCarloOption(**params, seed=42)
+                for n_sims in n_sims_list:
+                    mc_price = mc_option.price(n_simulations=n_sims, method=method)
+                    errors.append(abs(bs_price - mc_price))
+
+                self.assertLess(errors[-1], errors[0], "Error should decrease as number of simulations increases.")
+
+                # Low-discrepancy sampling converges much faster than pseudo-random sampling
+                self.assertLess(errors[-1], 0.01, "Error with 100000 quasi-random simulations should be less than 0.01.")
+
+    def test_price_convergence_nested_samples(self):
+        """
+        Test that prices computed from prefixes of a single sample converge toward Black-Scholes,
+        and that the largest one matches a direct NumPy estimate drawn from the same seed.
+        """
+        params = {
+            'S': 100,
+            'K': 100,
+            'T': 1,
+            'r': 0.05,
+            'sigma': 0.2,
+            'option_type': 'call'
+        }
+
+        bs_price = BlackScholesOption(**params).price()
+
+        n_sims_list = [1000, 10000, 100000]
+        mc_prices = MonteCarloOption(**params, seed=42).price_convergence(n_sims_list)
+        errors = [abs(bs_price - mc_price) for mc_price in mc_prices]
+
+        self.assertLess(errors[-1], errors[0], "Error should decrease as number of simulations increases.")
+        self.assertLess(errors[-1], 0.05, "Error with 100000 simulations should be less than 0.05.")
+
+        direct_price = MonteCarloOption(**params, seed=42).price(n_simulations=100000, backend='numpy')
+        self.assertAlmostEqual(mc_prices[-1], direct_price, places=10)
+
+    def test_backends_match_black_scholes(self):
+        """
+        Test that every computation backend prices close to Black-Scholes with pseudo-random sampling.
+        """
+        params = {
+            'S': 100,
+            'K': 100,
+            'T': 1,
+            'r': 0.05,
+            'sigma': 0.2,
+            'option_type': 'call'
+        }
+
+        bs_price = BlackScholesOption(**params).price()
+
+        configs = [
+            {'backend': 'numba'},
+            {'backend': 'numpy'},
+            {'backend': 'numpy', 'dtype': np.float32},
+            {'backend': 'numpy', 'device': 'cuda'},
+            {'backend': 'numexpr'},
+        ]
 
+        for config in configs:
+            with self.subTest(**config):
+                if config.get('device') == 'cuda' and importlib.util.find_spec('cupy') is None:
+                    self.skipTest("CuPy is not installed")
+                if config.get('backend') == 'numexpr' and importlib.util.find_spec('numexpr') is None:
+                    self.skipTest("numexpr is not installed")
+                mc_option = MonteCarloOption(**params, seed=42)
+                mc_price = mc_option.price(n_simulations=100000, **config)
+                self.assertLess(abs(bs_price - mc_price), 0.05)
 
 if __name__ == '__main__':
     unittest.main()